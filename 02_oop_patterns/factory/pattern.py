@@ -1,25 +1,48 @@
 """Factory pattern to create concrete payment strategy objects for
 `OrderProcessor` without coupling it to specific payment providers."""
 
-from strategies import PaymentStrategyV3
+import logging
+from functools import lru_cache
+
+from strategies import STRATEGIES, PaymentStrategyV3
+
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def _build(payment: str, kwargs_items: tuple) -> PaymentStrategyV3:
+    # A strategy's only state is its per-client credentials, and those are the
+    # cache key, so an instance is shared only between requests for the same
+    # client (e.g. webhook replays), never across clients. Shared instances
+    # must be immutable, as the frozen built-in strategies are
+    return STRATEGIES[payment](**dict(kwargs_items))
 
 
 # Factory
 class PaymentFactory:
-    def __init__(self):
-        self.__strategies = {}
+    # Dispatches straight from the shared STRATEGIES registry, so no
+    # factory instance or setup calls are needed before creating payments
 
-    def set_strategies(self, strategies: dict):
-        self.__strategies = strategies
+    @staticmethod
+    def register_strategy(name: str, strategy: type[PaymentStrategyV3]):
+        STRATEGIES[name] = strategy
+        _build.cache_clear()
 
-    def register_strategy(self, name: str, strategy: PaymentStrategyV3):
-        self.__strategies[name] = strategy
-
-    def create_payment(self, payment: str, **kwargs) -> PaymentStrategyV3:
-        strategy_class = self.__strategies.get(payment)
-        if not strategy_class:
+    @staticmethod
+    def create_payment(payment: str, **kwargs) -> PaymentStrategyV3:
+        if payment not in STRATEGIES:
             raise ValueError(f"Payment method '{payment}' is not supported.")
-        return strategy_class(**kwargs)
+        key = tuple(sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable credentials can't be a cache key; build a fresh instance
+            return STRATEGIES[payment](**kwargs)
+        return _build(payment, key)
+
+    @staticmethod
+    def cache_clear():
+        _build.cache_clear()
 
 
 class OrderProcessorV5:
@@ -31,7 +54,7 @@ class OrderProcessorV5:
 
     def process_order(self):
         # Simulate order total calculation
-        print("[V5] Processing order ")
+        log.debug("[V5] Processing order")
 
 
 def main():
@@ -43,3 +66,8 @@ def main():
         payment=payment,
     )
     orderProcessor.process_order()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    main()
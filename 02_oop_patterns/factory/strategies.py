@@ -4,29 +4,31 @@ using the Strategy Pattern.
 This pattern complements the Factory Pattern in pattern.py
 """
 
-from abc import ABC, abstractmethod
+import logging
+from dataclasses import dataclass
+from typing import Protocol
 
+log = logging.getLogger(__name__)
 
-class PaymentStrategyV3(ABC):
-    @abstractmethod
-    def process_payment(self, total: float):
-        pass
+
+class PaymentStrategyV3(Protocol):
+    def process_payment(self, total: float): ...
 
 
-class StripePaymentV3(PaymentStrategyV3):
-    def __init__(self, client_id: str):
-        self.client_id = client_id
+@dataclass(frozen=True, slots=True)
+class StripePaymentV3:
+    client_id: str
 
     def process_payment(self, total: float):
-        print(f"[V3] Stripe: Charging {self.client_id} for ${total}")
+        log.debug("[V3] Stripe: Charging %s for $%s", self.client_id, total)
 
 
-class CryptoPaymentV3(PaymentStrategyV3):
-    def __init__(self, wallet_address: str):
-        self.wallet_address = wallet_address
+@dataclass(frozen=True, slots=True)
+class CryptoPaymentV3:
+    wallet_address: str
 
     def process_payment(self, total: float):
-        print(f"[V3] Crypto: Charging {self.wallet_address} for ${total}")
+        log.debug("[V3] Crypto: Charging %s for $%s", self.wallet_address, total)
 
 
 STRATEGIES = {
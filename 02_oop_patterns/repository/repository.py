@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 
 # Domain model
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[int]
     username: str
@@ -18,10 +18,19 @@ class UserRepository(ABC):
     def add(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    def add_many(self, users: Iterable[User]) -> List[User]:
+        pass
+
     @abstractmethod
     def get_by_id(self, user_id: int) -> Optional[User]:
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, ids: Iterable[int]) -> Dict[int, User]:
+        # One lookup for a batch of ids instead of one get_by_id per id
+        pass
+
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[User]:
         pass
@@ -30,6 +39,16 @@ class UserRepository(ABC):
     def get_all(self) -> List[User]:
         pass
 
+    @abstractmethod
+    def get_users_older_than(self, age: int) -> List[User]:
+        # Users whose age is at least `age`; lets backends filter at the source
+        pass
+
+    @abstractmethod
+    def count_users_older_than(self, age: int) -> int:
+        # Cardinality only, without materializing the matching users
+        pass
+
     @abstractmethod
     def update(self, user: User) -> bool:
         pass
@@ -43,34 +62,87 @@ class UserRepository(ABC):
 class InMemoryUserRepository(UserRepository):
     def __init__(self):
         self._users = {}
+        # Secondary index so username lookups don't scan every user
+        self._by_username = {}
+        # Username each id is indexed under; callers may mutate the stored User
+        # in place before update(), so the object itself can't tell us the old key
+        self._username_by_id: Dict[int, str] = {}
         self._next_id = 1
 
     def add(self, user: User) -> User:
+        if user.username in self._by_username:
+            raise ValueError(f"Username '{user.username}' already exists")
         user.id = self._next_id
         self._users[self._next_id] = user
+        self._by_username[user.username] = user
+        self._username_by_id[user.id] = user.username
         self._next_id += 1
         return user
 
+    def add_many(self, users: Iterable[User]) -> List[User]:
+        users = list(users)
+        usernames = [u.username for u in users]
+        if len(set(usernames)) != len(usernames) or not self._by_username.keys().isdisjoint(
+            usernames
+        ):
+            raise ValueError("Batch contains an existing or duplicated username")
+
+        for user_id, user in zip(
+            range(self._next_id, self._next_id + len(users)), users, strict=True
+        ):
+            user.id = user_id
+        by_id = {u.id: u for u in users}
+        by_username = dict(zip(usernames, users, strict=True))
+        username_by_id = {u.id: u.username for u in users}
+        if self._users:
+            # Merging a whole dict resizes the target once, up front,
+            # rather than growing it step by step as single inserts would
+            self._users.update(by_id)
+            self._by_username.update(by_username)
+            self._username_by_id.update(username_by_id)
+        else:
+            # Initial bulk load: adopt the freshly built tables as-is
+            self._users = by_id
+            self._by_username = by_username
+            self._username_by_id = username_by_id
+        self._next_id += len(users)
+        return users
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         return self._users.get(user_id)
 
+    def get_many_by_ids(self, ids: Iterable[int]) -> Dict[int, User]:
+        users = self._users
+        return {user_id: users[user_id] for user_id in ids if user_id in users}
+
     def get_by_username(self, username: str) -> Optional[User]:
-        for user in self._users.values():
-            if user.username == username:
-                return user
-        return None
+        return self._by_username.get(username)
 
     def get_all(self) -> List[User]:
         return list(self._users.values())
 
+    def get_users_older_than(self, age: int) -> List[User]:
+        return [u for u in self._users.values() if u.age >= age]
+
+    def count_users_older_than(self, age: int) -> int:
+        return sum(1 for u in self._users.values() if u.age >= age)
+
     def update(self, user: User) -> bool:
-        if user.id in self._users:
-            self._users[user.id] = user
-            return True
-        return False
+        old_username = self._username_by_id.get(user.id)
+        if old_username is None:
+            return False
+        if old_username != user.username:
+            if user.username in self._by_username:
+                raise ValueError(f"Username '{user.username}' already exists")
+            del self._by_username[old_username]
+        self._users[user.id] = user
+        self._by_username[user.username] = user
+        self._username_by_id[user.id] = user.username
+        return True
 
     def delete(self, user_id: int) -> bool:
         if user_id in self._users:
+            del self._by_username[self._username_by_id.pop(user_id)]
             del self._users[user_id]
             return True
         return False
@@ -80,6 +152,8 @@ class InMemoryUserRepository(UserRepository):
 class SQLiteUserRepository(UserRepository):
     def __init__(self, connection):
         self.conn = connection
+        # IN (...) statements keyed by number of placeholders
+        self._prepared: Dict[int, str] = {}
         self._create_table()
 
     def _create_table(self):
@@ -92,11 +166,34 @@ class SQLiteUserRepository(UserRepository):
         user.id = 1  # Would get from database
         return user
 
+    def add_many(self, users: Iterable[User]) -> List[User]:
+        users = list(users)
+        rows = [(u.username, u.email, u.age) for u in users]
+        # Would execute, in a single transaction:
+        #   cur.executemany("INSERT INTO users(username,email,age) VALUES (?,?,?)", rows)
+        # and assign ids from the first inserted rowid
+        print(f"Bulk inserting {len(rows)} users into SQLite")
+        for offset, user in enumerate(users, start=1):
+            user.id = offset  # Would get from database
+        return users
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         # Would execute: SELECT * FROM users WHERE id = ?
         print(f"Querying SQLite for user ID {user_id}")
         return None
 
+    def get_many_by_ids(self, ids: Iterable[int]) -> Dict[int, User]:
+        ids = list(ids)
+        sql = self._prepared.get(len(ids))
+        if sql is None:
+            placeholders = ",".join("?" * len(ids))
+            sql = f"SELECT id, username, email, age FROM users WHERE id IN ({placeholders})"
+            self._prepared[len(ids)] = sql
+        # Would execute: cur = self.conn.execute(sql, ids)
+        # and return {row[0]: User(*row) for row in cur}
+        print(f"Querying SQLite for {len(ids)} user IDs: {sql}")
+        return {}
+
     def get_by_username(self, username: str) -> Optional[User]:
         print(f"Querying SQLite for username {username}")
         return None
@@ -105,6 +202,16 @@ class SQLiteUserRepository(UserRepository):
         print("Fetching all users from SQLite")
         return []
 
+    def get_users_older_than(self, age: int) -> List[User]:
+        # Would execute: SELECT * FROM users WHERE age >= ?
+        print(f"Querying SQLite for users aged {age} or older")
+        return []
+
+    def count_users_older_than(self, age: int) -> int:
+        # Would execute: SELECT COUNT(*) FROM users WHERE age >= ?
+        print(f"Counting SQLite users aged {age} or older")
+        return 0
+
     def update(self, user: User) -> bool:
         print(f"Updating user {user.id} in SQLite")
         return True
@@ -118,6 +225,12 @@ class SQLiteUserRepository(UserRepository):
 class UserService:
     def __init__(self, repository: UserRepository):
         self.repository = repository
+        # Bound once so hot paths skip the repository attribute lookup
+        self._add = repository.add
+        self._add_many = repository.add_many
+        self._get_by_username = repository.get_by_username
+        self._get_users_older_than = repository.get_users_older_than
+        self._count_users_older_than = repository.count_users_older_than
 
     def register_user(self, username: str, email: str, age: int) -> User:
         # Business validation
@@ -125,17 +238,28 @@ class UserService:
             raise ValueError("User must be 18 or older")
 
         # Check if username exists
-        existing = self.repository.get_by_username(username)
+        existing = self._get_by_username(username)
         if existing:
             raise ValueError("Username already taken")
 
         # Create and save user
         user = User(id=None, username=username, email=email, age=age)
-        return self.repository.add(user)
+        return self._add(user)
+
+    def register_users(self, users: Iterable[Tuple[str, str, int]]) -> List[User]:
+        # Validate the whole batch up front so nothing is stored on failure
+        new_users = []
+        for username, email, age in users:
+            if age < 18:
+                raise ValueError("User must be 18 or older")
+            new_users.append(User(id=None, username=username, email=email, age=age))
+        return self._add_many(new_users)
 
     def get_adult_users(self) -> List[User]:
-        all_users = self.repository.get_all()
-        return [u for u in all_users if u.age >= 18]
+        return self._get_users_older_than(18)
+
+    def count_adult_users(self) -> int:
+        return self._count_users_older_than(18)
 
 
 # Usage
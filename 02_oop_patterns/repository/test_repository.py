@@ -0,0 +1,37 @@
+"""Tests for the in-memory user repository"""
+
+import pytest
+from repository import InMemoryUserRepository, User
+
+
+@pytest.fixture
+def repo():
+    repository = InMemoryUserRepository()
+    repository.add(User(id=None, username="a", email="a@test.com", age=25))
+    return repository
+
+
+def test_update_after_in_place_rename_reindexes_username(repo):
+    user = repo.get_by_id(1)
+    user.username = "zz"
+
+    assert repo.update(user) is True
+    assert repo.get_by_username("a") is None
+    assert repo.get_by_username("zz") is user
+    # The old name is free again
+    repo.add(User(id=None, username="a", email="a2@test.com", age=30))
+
+
+def test_update_rejects_taken_username(repo):
+    repo.add(User(id=None, username="b", email="b@test.com", age=30))
+
+    with pytest.raises(ValueError):
+        repo.update(User(id=1, username="b", email="a@test.com", age=25))
+
+
+def test_delete_after_bulk_load_frees_username():
+    repository = InMemoryUserRepository()
+    repository.add_many([User(id=None, username="a", email="a@test.com", age=25)])
+
+    assert repository.delete(1) is True
+    assert repository.get_by_username("a") is None
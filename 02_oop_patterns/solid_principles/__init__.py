@@ -5,6 +5,8 @@ This package demonstrates the incremental application of SOLID principles
 to refactor a monolithic OrderProcessor into a clean, maintainable design.
 
 Quick Start:
+    import asyncio
+
     from solid_principles import OrderProcessorV5, StripePaymentV3, ...
 
     processor = OrderProcessorV5(
@@ -14,6 +16,7 @@ Quick Start:
         logger=FileLoggerV5(),
         payment=StripePaymentV3(client_id="..."),
     )
+    asyncio.run(processor.process_order("order_001", items, "user@example.com"))
 
 Versions:
     V0: Monolith (violates all principles)
@@ -32,10 +35,13 @@ Structure:
     │   ├── notification_isp_violation.py
     │   └── order_processor_dip_violation.py
     ├── after/                          # Clean implementations
-    │   ├── abstractions.py             # All ABC interfaces
+    │   ├── abstractions.py             # All interfaces
     │   ├── implementations.py          # Concrete classes
     │   └── order_processor_final.py    # Complete working example
+    ├── abstractions.py                 # Protocols shared by LSP/ISP/DIP
+    ├── implementations.py              # Concrete classes shared by ISP/DIP
     ├── order_processor_evolution.py    # V0→V5 in one file
+    ├── __main__.py                     # python -m solid_principles runs the V0→V5 demo
     ├── single_responsibility.py        # SRP principle
     ├── open_closed.py                  # OCP principle
     ├── liskov_substitution.py          # LSP principle
@@ -0,0 +1,9 @@
+"""Run the V0→V5 evolution demo: `python -m solid_principles` from 02_oop_patterns/."""
+
+import logging
+
+from .order_processor_evolution import demo, log
+
+logging.basicConfig(format="%(message)s")
+log.setLevel(logging.DEBUG)
+demo()
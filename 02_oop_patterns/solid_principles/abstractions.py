@@ -0,0 +1,30 @@
+"""
+module with the interfaces shared by the LSP, ISP and DIP examples.
+Concrete classes satisfy them structurally; see implementations.py.
+"""
+
+from typing import Protocol
+
+
+class PaymentStrategy(Protocol):
+    def process_payment(self, total_amount: float): ...
+
+
+class EmailSender(Protocol):
+    def send_email(self, message): ...
+
+
+class SMSSender(Protocol):
+    def send_sms(self, message): ...
+
+
+class SlackSender(Protocol):
+    def send_slack_message(self, message): ...
+
+
+class Logger(Protocol):
+    def log(self, message): ...
+
+
+class OrderRepository(Protocol):
+    def insert_order(self, order_id, total): ...
@@ -0,0 +1,126 @@
+"""
+module with the concrete classes shared by the ISP and DIP examples,
+satisfying the interfaces in abstractions.py.
+"""
+
+import logging
+import threading
+import weakref
+from functools import lru_cache
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
+
+
+class StripePayment:
+    __slots__ = ("client_id",)
+
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+
+    def process_payment(self, total_amount: float):
+        log.debug("Stripe: charging account %s for $%s", self.client_id, total_amount)
+
+
+class PaypalPayment:
+    __slots__ = ("client_id",)
+
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+
+    def process_payment(self, total_amount: float):
+        log.debug("PayPal: charging account %s for $%s", self.client_id, total_amount)
+
+
+class CryptoPayment:
+    __slots__ = ("wallet_address",)
+
+    def __init__(self, wallet_address: str):
+        self.wallet_address = wallet_address
+
+    def process_payment(self, total_amount: float):
+        log.debug("Crypto: charging wallet %s for $%s", self.wallet_address, total_amount)
+
+
+class LineItem(NamedTuple):
+    price: float
+    quantity: int
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    # Imported on the first bulk total, so the examples that never compute
+    # one don't pay NumPy's import time
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional; bulk totals fall back to the Python sum
+        return None
+    return numpy
+
+
+def bulk_total(prices, quantities) -> float:
+    """Total of a cart stored as parallel price and quantity arrays."""
+    np = _numpy()
+    if np is None:
+        return sum(p * q for p, q in zip(prices, quantities, strict=True))
+    return float(np.dot(prices, quantities))
+
+
+class OrderCalculator:
+    def calculate_total(self, items: list[LineItem]):
+        # Plain sum on purpose: a cache key would walk the cart just like the
+        # sum does, and an array copy costs more than the multiply-add it saves
+        return sum(price * quantity for price, quantity in items)
+
+    def calculate_total_bulk(self, prices, quantities) -> float:
+        # For carts already stored as parallel price/quantity arrays
+        return bulk_total(prices, quantities)
+
+
+class PostgreSQLOrderRepository:
+    def insert_order(self, order_id, total):
+        log.debug("PostgreSQL: INSERT INTO orders (id, total) VALUES (%s, %s)", order_id, total)
+
+
+# The ISP example's name for the same repository
+DatabaseOrderProcessor = PostgreSQLOrderRepository
+
+
+class NotificationProcessor:
+    # Satisfies EmailSender and SMSSender structurally, not by inheritance
+
+    def send_email(self, message):
+        # implementation
+        log.debug("SMTP send: %s", message)
+
+    def send_sms(self, message):
+        # implementation
+        log.debug("SMS send: %s", message)
+
+
+class CloudLogger:
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    def log(self, message):
+        log.debug("Cloud log: %s", message)
+
+
+class FileLogger:
+    def __init__(self, path: str = "app.log"):
+        # Keep one buffered handle open instead of open/write/close per message
+        self._fh = open(path, "a", buffering=1 << 16)  # noqa: SIM115
+        # Flushes and closes when the logger is collected or at interpreter exit,
+        # without pinning every instance's handle in the atexit registry
+        self._close = weakref.finalize(self, self._fh.close)
+        # The buffered handle is not thread-safe, and loggers may be called
+        # from worker threads by concurrent orders
+        self._lock = threading.Lock()
+
+    def log(self, message):
+        with self._lock:
+            self._fh.write(f"{message}\n")
+
+    def close(self):
+        with self._lock:
+            self._close()
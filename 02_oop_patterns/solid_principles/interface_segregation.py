@@ -2,88 +2,19 @@
 refactoring the Liskov Substitution Principle (LSP) example in the
 liskov_substitution.md file."""
 
-from abc import ABC
-from abc import abstractmethod
-
-
-class PaymentStrategy(ABC):
-    @abstractmethod
-    def process_payment(self, total_amount: float):
-        pass
-
-
-class StripePayment(PaymentStrategy):
-    def __init__(self, client_id: str):
-        self.client_id = client_id
-
-    def process_payment(self, total_amount: float):
-        print("Connecting to Stripe...")
-        print(f"Charging account {self.client_id} for ${total_amount}")
-
-
-class PaypalPayment(PaymentStrategy):
-    def __init__(self, client_id: str):
-        self.client_id = client_id
-
-    def process_payment(self, total_amount: float):
-        print("Connecting to PayPal...")
-        print(f"Charging account {self.client_id} for ${total_amount}")
-
-
-class CryptoPayment(PaymentStrategy):
-    def __init__(self, wallet_address: str):
-        self.wallet_address = wallet_address
-
-    def process_payment(self, total_amount: float):
-        print("Connecting to Crypto Gateway...")
-        print(f"Charging wallet {self.wallet_address} for ${total_amount}")
-
-
-class OrderCalculator:
-    def calculate_total(self, items):
-        return sum(item["price"] * item["quantity"] for item in items)
-
-
-class DatabaseOrderProcessor:
-    def insert_order(self, order_id, total):
-        print("Connecting to PostgreSQL...")
-        print(f"INSERT INTO orders (id, total) VALUES ({order_id}, {total})")
-
-
-class EmailSender(ABC):
-    @abstractmethod
-    def send_email(self, message):
-        pass
-
-
-class SMSSender(ABC):
-    @abstractmethod
-    def send_sms(self, message):
-        pass
-
-
-class SlackSender(ABC):
-    @abstractmethod
-    def send_slack_message(self, message):
-        pass
-
-
-class NotificationProcessor(EmailSender, SMSSender):
-    def send_email(self, message):
-        # implementation
-        print("Connecting to SMTP server...")
-        print(f"Sending email: {message}")
-
-    def send_sms(self, message):
-        # implementation
-        print("Connecting to SMS gateway...")
-        print(f"Sending SMS: {message}")
-
-
-class FileLogger:
-    def log(self, message):
-        with open("app.log", "a") as f:
-            f.write(f"{message}\n")
+import logging
+
+from abstractions import EmailSender, PaymentStrategy, SlackSender, SMSSender  # noqa: F401
+from implementations import (  # noqa: F401
+    CryptoPayment,
+    DatabaseOrderProcessor,
+    FileLogger,
+    LineItem,
+    NotificationProcessor,
+    OrderCalculator,
+    PaypalPayment,
+    StripePayment,
+)
 
 
 class OrderProcessor:
@@ -111,7 +42,9 @@ class OrderProcessor:
 
 # Example usage:
 if __name__ == "__main__":
-    items = [{"price": 10.0, "quantity": 2}, {"price": 5.0, "quantity": 1}]
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("implementations").setLevel(logging.DEBUG)
+    items = [LineItem(price=10.0, quantity=2), LineItem(price=5.0, quantity=1)]
 calculator = OrderCalculator()
 
 database = DatabaseOrderProcessor()
@@ -3,17 +3,11 @@ module to implement Liskov Substitution Principle (LSP) example
 refactoring the Open/Closed Principle (OCP) example in the open_closed.md file.
 """
 
-from abc import ABC
-from abc import abstractmethod
+from abstractions import PaymentStrategy
+from implementations import FileLogger
 
 
-class PaymentStrategy(ABC):
-    @abstractmethod
-    def process_payment(self, total_amount: float):
-        pass
-
-
-class StripePayment(PaymentStrategy):
+class StripePayment:
     def __init__(self, client_id: str):
         self.client_id = client_id
 
@@ -22,7 +16,7 @@ class StripePayment(PaymentStrategy):
         print(f"Charging account {self.client_id} for ${total_amount}")
 
 
-class PaypalPayment(PaymentStrategy):
+class PaypalPayment:
     def __init__(self, client_id: str):
         self.client_id = client_id
 
@@ -31,7 +25,7 @@ class PaypalPayment(PaymentStrategy):
         print(f"Charging account {self.client_id} for ${total_amount}")
 
 
-class CryptoPayment(PaymentStrategy):
+class CryptoPayment:
     def __init__(self, wallet_address: str):
         self.wallet_address = wallet_address
 
@@ -58,12 +52,6 @@ class EmailProcessor:
         print(f"Sending confirmation email to {user_email}")
 
 
-class FileLogger:
-    def log(self, message):
-        with open("app.log", "a") as f:
-            f.write(f"{message}\n")
-
-
 # refactor orderProcessor to include paymentStrategy
 
 
@@ -6,6 +6,8 @@ through paymentStrategy and concrete implementations
 
 from abc import ABC, abstractmethod
 
+from implementations import FileLogger
+
 
 class PaymentStrategy(ABC):
     @abstractmethod
@@ -41,12 +43,6 @@ class EmailProcessor:
         print(f"Sending confirmation email to {user_email}")
 
 
-class FileLogger:
-    def log(self, message):
-        with open("app.log", "a") as f:
-            f.write(f"{message}\n")
-
-
 # refactor orderProcessor to include paymentStrategy
 
 
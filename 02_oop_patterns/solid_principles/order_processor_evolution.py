@@ -11,11 +11,17 @@ V3: After LSP - Unified method signatures for substitutability
 V4: After ISP - Focused notification interfaces
 V5: After DIP - All dependencies are abstractions
 
-Run this file to see each version in action:
-    python order_processor_evolution.py
+Run the package from 02_oop_patterns/ to see each version in action:
+    python -m solid_principles
 """
 
-from abc import ABC, abstractmethod
+import asyncio
+import logging
+from typing import Protocol
+
+from .implementations import bulk_total
+
+log = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -40,16 +46,16 @@ class OrderProcessorV0:
         total = sum(item["price"] * item["quantity"] for item in items)
 
         # 2. Process payment (hardcoded Stripe)
-        print(f"[V0] Connecting to Stripe... Charging ${total}")
+        log.debug("[V0] Connecting to Stripe... Charging $%s", total)
 
         # 3. Save to database (hardcoded PostgreSQL)
-        print(f"[V0] INSERT INTO orders VALUES ({order_id}, {total})")
+        log.debug("[V0] INSERT INTO orders VALUES (%s, %s)", order_id, total)
 
         # 4. Send email
-        print(f"[V0] Sending email to {user_email}")
+        log.debug("[V0] Sending email to %s", user_email)
 
         # 5. Log
-        print(f"[V0] Logged: Order {order_id} processed")
+        log.debug("[V0] Logged: Order %s processed", order_id)
 
         return total
 
@@ -70,28 +76,28 @@ class PaymentProcessorV1:
     """SRP: Only handles payments."""
 
     def process_payment(self, gateway, total, client_id):
-        print(f"[V1] {gateway}: Charging {client_id} for ${total}")
+        log.debug("[V1] %s: Charging %s for $%s", gateway, client_id, total)
 
 
 class DatabaseV1:
     """SRP: Only handles persistence."""
 
     def insert_order(self, order_id, total):
-        print(f"[V1] INSERT INTO orders VALUES ({order_id}, {total})")
+        log.debug("[V1] INSERT INTO orders VALUES (%s, %s)", order_id, total)
 
 
 class EmailProcessorV1:
     """SRP: Only sends emails."""
 
     def send_confirmation(self, user_email):
-        print(f"[V1] Sending confirmation to {user_email}")
+        log.debug("[V1] Sending confirmation to %s", user_email)
 
 
 class FileLoggerV1:
     """SRP: Only handles logging."""
 
     def log(self, message):
-        print(f"[V1] LOG: {message}")
+        log.debug("[V1] LOG: %s", message)
 
 
 class OrderProcessorV1:
@@ -103,6 +109,8 @@ class OrderProcessorV1:
     - DIP ❌ Depends on concrete classes
     """
 
+    __slots__ = ("calculator", "payment", "database", "email", "logger")
+
     def __init__(self):
         self.calculator = OrderCalculatorV1()
         self.payment = PaymentProcessorV1()
@@ -124,26 +132,24 @@ class OrderProcessorV1:
 # ============================================================================
 
 
-class PaymentStrategyV2(ABC):
-    """OCP: Abstract base for payment strategies."""
+class PaymentStrategyV2(Protocol):
+    """OCP: Interface for payment strategies."""
 
-    @abstractmethod
-    def process_payment(self, total: float, client_id: str):
-        pass
+    def process_payment(self, total: float, client_id: str): ...
 
 
-class StripePaymentV2(PaymentStrategyV2):
+class StripePaymentV2:
     """OCP: New payment method without modifying existing code."""
 
     def process_payment(self, total: float, client_id: str):
-        print(f"[V2] Stripe: Charging {client_id} for ${total}")
+        log.debug("[V2] Stripe: Charging %s for $%s", client_id, total)
 
 
-class PaypalPaymentV2(PaymentStrategyV2):
+class PaypalPaymentV2:
     """OCP: Another payment method - no modification needed."""
 
     def process_payment(self, total: float, client_id: str):
-        print(f"[V2] PayPal: Charging {client_id} for ${total}")
+        log.debug("[V2] PayPal: Charging %s for $%s", client_id, total)
 
 
 class OrderProcessorV2:
@@ -156,6 +162,8 @@ class OrderProcessorV2:
     - DIP ❌ Still uses concrete classes for db, email, logger
     """
 
+    __slots__ = ("calculator", "payment", "database", "email", "logger", "client_id")
+
     def __init__(self, payment: PaymentStrategyV2):
         self.calculator = OrderCalculatorV1()
         self.payment = payment
@@ -178,30 +186,32 @@ class OrderProcessorV2:
 # ============================================================================
 
 
-class PaymentStrategyV3(ABC):
+class PaymentStrategyV3(Protocol):
     """LSP: Unified signature - credentials in __init__, not process_payment."""
 
-    @abstractmethod
-    def process_payment(self, total: float):
-        pass
+    def process_payment(self, total: float): ...
+
 
+class StripePaymentV3:
+    __slots__ = ("client_id",)
 
-class StripePaymentV3(PaymentStrategyV3):
     def __init__(self, client_id: str):
         self.client_id = client_id
 
     def process_payment(self, total: float):
-        print(f"[V3] Stripe: Charging {self.client_id} for ${total}")
+        log.debug("[V3] Stripe: Charging %s for $%s", self.client_id, total)
 
 
-class CryptoPaymentV3(PaymentStrategyV3):
+class CryptoPaymentV3:
     """LSP ✅ Same signature as other strategies - wallet in __init__."""
 
+    __slots__ = ("wallet_address",)
+
     def __init__(self, wallet_address: str):
         self.wallet_address = wallet_address
 
     def process_payment(self, total: float):
-        print(f"[V3] Crypto: Charging {self.wallet_address} for ${total}")
+        log.debug("[V3] Crypto: Charging %s for $%s", self.wallet_address, total)
 
 
 class OrderProcessorV3:
@@ -215,6 +225,8 @@ class OrderProcessorV3:
     - DIP ❌ Still depends on concrete classes
     """
 
+    __slots__ = ("calculator", "payment", "database", "email", "logger")
+
     def __init__(self, payment: PaymentStrategyV3):
         self.calculator = OrderCalculatorV1()
         self.payment = payment
@@ -236,37 +248,33 @@ class OrderProcessorV3:
 # ============================================================================
 
 
-class EmailSenderV4(ABC):
+class EmailSenderV4(Protocol):
     """ISP: Focused interface for email only."""
 
-    @abstractmethod
-    def send_email(self, message: str):
-        pass
+    def send_email(self, message: str, *args): ...
 
 
-class SMSSenderV4(ABC):
+class SMSSenderV4(Protocol):
     """ISP: Focused interface for SMS only."""
 
-    @abstractmethod
-    def send_sms(self, message: str):
-        pass
+    def send_sms(self, message: str): ...
 
 
-class EmailNotifierV4(EmailSenderV4):
+class EmailNotifierV4:
     """ISP ✅ Implements only what it needs."""
 
-    def send_email(self, message: str):
-        print(f"[V4] Email: {message}")
+    def send_email(self, message: str, *args):
+        log.debug("[V4] Email: " + message, *args)
 
 
-class MultiNotifierV4(EmailSenderV4, SMSSenderV4):
+class MultiNotifierV4:
     """ISP ✅ Implements multiple interfaces by choice, not force."""
 
-    def send_email(self, message: str):
-        print(f"[V4] Email: {message}")
+    def send_email(self, message: str, *args):
+        log.debug("[V4] Email: " + message, *args)
 
     def send_sms(self, message: str):
-        print(f"[V4] SMS: {message}")
+        log.debug("[V4] SMS: %s", message)
 
 
 class OrderProcessorV4:
@@ -280,6 +288,8 @@ class OrderProcessorV4:
     - DIP ❌ Still depends on concrete OrderCalculator, Database, Logger
     """
 
+    __slots__ = ("calculator", "payment", "database", "notifier", "logger")
+
     def __init__(self, payment: PaymentStrategyV3, notifier: EmailSenderV4):
         self.calculator = OrderCalculatorV1()  # Concrete!
         self.payment = payment
@@ -301,40 +311,44 @@ class OrderProcessorV4:
 # ============================================================================
 
 
-class OrderRepositoryV5(ABC):
+class OrderRepositoryV5(Protocol):
     """DIP: Abstraction for persistence."""
 
-    @abstractmethod
-    def insert_order(self, order_id: str, total: float):
-        pass
+    def insert_order(self, order_id: str, total: float): ...
+
+    def insert_orders(self, rows: list[tuple[str, float]]): ...
 
 
-class LoggerV5(ABC):
+class LoggerV5(Protocol):
     """DIP: Abstraction for logging."""
 
-    @abstractmethod
-    def log(self, message: str):
-        pass
+    def log(self, message: str, *args): ...
 
 
-class PostgreSQLRepositoryV5(OrderRepositoryV5):
+class PostgreSQLRepositoryV5:
     def insert_order(self, order_id: str, total: float):
-        print(f"[V5] PostgreSQL: INSERT ({order_id}, {total})")
+        log.debug("[V5] PostgreSQL: INSERT (%s, %s)", order_id, total)
 
+    def insert_orders(self, rows: list[tuple[str, float]]):
+        log.debug("[V5] PostgreSQL: executemany INSERT (%d rows)", len(rows))
 
-class MongoDBRepositoryV5(OrderRepositoryV5):
+
+class MongoDBRepositoryV5:
     def insert_order(self, order_id: str, total: float):
-        print(f"[V5] MongoDB: insertOne({order_id}, {total})")
+        log.debug("[V5] MongoDB: insertOne(%s, %s)", order_id, total)
+
+    def insert_orders(self, rows: list[tuple[str, float]]):
+        log.debug("[V5] MongoDB: insertMany(%d documents)", len(rows))
 
 
-class FileLoggerV5(LoggerV5):
-    def log(self, message: str):
-        print(f"[V5] FileLog: {message}")
+class FileLoggerV5:
+    def log(self, message: str, *args):
+        log.debug("[V5] FileLog: " + message, *args)
 
 
-class CloudLoggerV5(LoggerV5):
-    def log(self, message: str):
-        print(f"[V5] CloudLog: {message}")
+class CloudLoggerV5:
+    def log(self, message: str, *args):
+        log.debug("[V5] CloudLog: " + message, *args)
 
 
 class OrderCalculatorV5:
@@ -343,6 +357,16 @@ class OrderCalculatorV5:
     def calculate_total(self, items):
         return sum(item["price"] * item["quantity"] for item in items)
 
+    def calculate_total_bulk(self, prices, quantities) -> float:
+        """Total for a cart already stored as parallel NumPy arrays."""
+        return bulk_total(prices, quantities)
+
+    def calculate_totals(self, carts: list[list]) -> list[float]:
+        """Totals for many carts at once."""
+        # Per-cart sums: pulling dict carts into arrays costs more than it saves
+        calculate_total = self.calculate_total
+        return [calculate_total(items) for items in carts]
+
 
 class OrderProcessorV5:
     """
@@ -355,6 +379,21 @@ class OrderProcessorV5:
     DIP ✅ Depends on abstractions - swap any implementation
     """
 
+    __slots__ = (
+        "calculator",
+        "repository",
+        "notifier",
+        "logger",
+        "payment",
+        "_calculate_total",
+        "_calculate_totals",
+        "_process_payment",
+        "_insert_order",
+        "_insert_orders",
+        "_send_email",
+        "_log",
+    )
+
     def __init__(
         self,
         calculator: OrderCalculatorV5,
@@ -368,15 +407,73 @@ class OrderProcessorV5:
         self.notifier = notifier
         self.logger = logger
         self.payment = payment
-
-    def process_order(self, order_id: str, items: list, user_email: str) -> float:
-        total = self.calculator.calculate_total(items)
-        self.payment.process_payment(total)
-        self.repository.insert_order(order_id, total)
-        self.notifier.send_email(f"Order {order_id} confirmed for {user_email}!")
-        self.logger.log(f"Order {order_id} processed: ${total}")
+        # The collaborators are fixed from here on, so bind their methods once
+        # and skip the self.<dep>.<method> lookup chain on every order
+        self._calculate_total = calculator.calculate_total
+        self._calculate_totals = calculator.calculate_totals
+        self._process_payment = payment.process_payment
+        self._insert_order = repository.insert_order
+        self._insert_orders = repository.insert_orders
+        self._send_email = notifier.send_email
+        self._log = logger.log
+
+    async def process_order(self, order_id: str, items: list, user_email: str) -> float:
+        total = self._calculate_total(items)
+        await asyncio.to_thread(self._process_payment, total)
+        # Persisting, notifying and logging are independent once paid,
+        # so they run concurrently instead of one after another
+        await asyncio.gather(
+            asyncio.to_thread(self._insert_order, order_id, total),
+            # Template and arguments go through unformatted; the sink formats
+            # only if the message is actually emitted
+            asyncio.to_thread(self._send_email, "Order %s confirmed for %s!", order_id, user_email),
+            asyncio.to_thread(self._log, "Order %s processed: $%s", order_id, total),
+        )
         return total
 
+    async def process_orders(self, orders: list[tuple[str, list, str]]) -> list[float]:
+        """Process a batch of (order_id, items, user_email) orders together."""
+        totals = self._calculate_totals([items for _, items, _ in orders])
+        process_payment = self._process_payment
+        send_email = self._send_email
+
+        def charge():
+            # Stops at the first failed payment and hands back the orders
+            # charged before it, so those are still persisted and notified
+            charged = []
+            for order, total in zip(orders, totals, strict=True):
+                try:
+                    process_payment(total)
+                except Exception as exc:
+                    return charged, exc
+                charged.append((order, total))
+            return charged, None
+
+        def notify():
+            for (order_id, _, user_email), _ in charged:
+                send_email("Order %s confirmed for %s!", order_id, user_email)
+
+        # Each stage crosses into a worker thread once per batch, not per order,
+        # and the repository writes every row in one round-trip
+        charged, error = await asyncio.to_thread(charge)
+        if charged:
+            await asyncio.gather(
+                asyncio.to_thread(
+                    self._insert_orders,
+                    [(order_id, total) for (order_id, _, _), total in charged],
+                ),
+                asyncio.to_thread(notify),
+                asyncio.to_thread(
+                    self._log,
+                    "%d orders processed: $%s",
+                    len(charged),
+                    sum(total for _, total in charged),
+                ),
+            )
+        if error is not None:
+            raise error
+        return totals
+
 
 # ============================================================================
 # DEMONSTRATION
@@ -429,7 +526,15 @@ def demo():
         logger=CloudLoggerV5(),
         payment=CryptoPaymentV3(wallet_address="0xDEF456"),
     )
-    v5.process_order("001", items, "user@example.com")
+    asyncio.run(v5.process_order("001", items, "user@example.com"))
+    asyncio.run(
+        v5.process_orders(
+            [
+                ("002", items, "ann@example.com"),
+                ("003", items * 20, "bob@example.com"),
+            ]
+        )
+    )
 
     print("\n" + "=" * 70)
     print("EVOLUTION SUMMARY")
@@ -441,7 +546,3 @@ def demo():
     V3 → V4: Split fat interface into EmailSender + SMSSender (ISP)
     V4 → V5: Abstract remaining concrete dependencies (DIP)
     """)
-
-
-if __name__ == "__main__":
-    demo()
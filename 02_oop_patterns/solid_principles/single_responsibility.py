@@ -3,6 +3,8 @@ module to implement Single Responsibility Principle (SRP) example
 refactoring the OrderProcessor in the single_responsibility.md file.
 """
 
+from implementations import FileLogger
+
 
 class OrderCalculator:
     def calculate_total(self, items):
@@ -29,12 +31,6 @@ class EmailProcessor:
         print(f"Sending confirmation email to {user_email}")
 
 
-class FileLogger:
-    def log(self, message):
-        with open("app.log", "a") as f:
-            f.write(f"{message}\n")
-
-
 # first order processor refactor
 
 
@@ -3,12 +3,26 @@ FastAPI Dependency Injection Examples
 Demonstrates various dependency patterns and use cases
 """
 
+import asyncio
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from dataclasses import dataclass
+from types import MappingProxyType
 from fastapi import FastAPI, Depends, HTTPException, Header
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
-app = FastAPI(title="FastAPI Dependency Injection Examples")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Shutdown: close the pooled connections handed out by get_db (Example 5)
+    close_db_pool()
+
+
+app = FastAPI(title="FastAPI Dependency Injection Examples", lifespan=lifespan)
 
 
 # ============================================================================
@@ -16,13 +30,19 @@ app = FastAPI(title="FastAPI Dependency Injection Examples")
 # ============================================================================
 
 
-def get_query_params(skip: int = 0, limit: int = 10):
+@lru_cache(maxsize=256)
+def _pagination(skip: int, limit: int) -> Mapping[str, int]:
+    # Shared across requests, so hand out a read-only view
+    return MappingProxyType({"skip": skip, "limit": limit})
+
+
+def get_query_params(skip: int = 0, limit: int = 10) -> Mapping[str, int]:
     """Simple dependency that extracts common query parameters"""
-    return {"skip": skip, "limit": limit}
+    return _pagination(skip, limit)
 
 
 @app.get("/items/")
-def read_items(params: dict = Depends(get_query_params)):
+def read_items(params: Mapping[str, int] = Depends(get_query_params)):
     """
     Route handler with dependency injection.
     The get_query_params function is automatically called with request parameters.
@@ -36,19 +56,21 @@ def read_items(params: dict = Depends(get_query_params)):
 
 
 class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     email: str
     is_active: bool = True
 
 
+@dataclass(slots=True, frozen=True)
 class PaginationParams:
     """Class-based dependency for pagination"""
 
-    def __init__(self, skip: int = 0, limit: int = 10, sort_by: str = "id"):
-        self.skip = skip
-        self.limit = limit
-        self.sort_by = sort_by
+    skip: int = 0
+    limit: int = 10
+    sort_by: str = "id"
 
 
 @app.get("/users/", response_model=dict)
@@ -145,6 +167,13 @@ def read_public_items(token: Optional[str] = Depends(get_optional_token)):
 # ============================================================================
 
 
+# Result of the simulated items query; built once and shared read-only
+_ITEMS = (
+    MappingProxyType({"id": 1, "name": "Item 1"}),
+    MappingProxyType({"id": 2, "name": "Item 2"}),
+)
+
+
 class Database:
     """Simulated database connection"""
 
@@ -156,22 +185,42 @@ class Database:
         self.connected = False
         print("Database closed")
 
-    def query(self, sql: str) -> List[dict]:
+    def query(self, sql: str) -> tuple[Mapping, ...]:
         if not self.connected:
             raise RuntimeError("Database connection is closed")
-        return [{"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"}]
+        return _ITEMS
+
+
+DB_POOL_SIZE = 5
 
+# Idle connections, reused across requests instead of connecting per call
+_db_pool: asyncio.LifoQueue[Database] = asyncio.LifoQueue()
+_db_created = 0
 
-def get_db():
+
+async def get_db():
     """
     Generator-based dependency for resource management.
-    Yields the resource and cleans up after use.
+    Lends a pooled connection and returns it to the pool after use.
     """
-    db = Database()
+    global _db_created
+    if _db_pool.empty() and _db_created < DB_POOL_SIZE:
+        _db_created += 1
+        db = Database()
+    else:
+        db = await _db_pool.get()
     try:
         yield db
     finally:
-        db.close()
+        _db_pool.put_nowait(db)
+
+
+def close_db_pool():
+    """Close every idle pooled connection; called once at application shutdown."""
+    global _db_created
+    while not _db_pool.empty():
+        _db_pool.get_nowait().close()
+        _db_created -= 1
 
 
 @app.get("/database/items")
@@ -254,8 +303,9 @@ def cache_demo(
 # ============================================================================
 
 
-def validate_limit(limit: int = 10) -> int:
-    """Dependency that validates and constrains limit parameter"""
+@lru_cache(maxsize=128)
+def _checked_limit(limit: int) -> int:
+    # Rejected values raise and are therefore never cached
     if limit > 100:
         raise HTTPException(status_code=400, detail="Limit cannot exceed 100")
     if limit < 1:
@@ -263,6 +313,11 @@ def validate_limit(limit: int = 10) -> int:
     return limit
 
 
+def validate_limit(limit: int = 10) -> int:
+    """Dependency that validates and constrains limit parameter"""
+    return _checked_limit(limit)
+
+
 @app.get("/validated-items")
 def get_validated_items(limit: int = Depends(validate_limit)):
     """
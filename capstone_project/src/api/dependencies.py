@@ -7,8 +7,22 @@ from ..services.user import UserService
 
 
 def get_user_service(
-    session: AsyncSession = Depends(get_session_db),
+    session: AsyncSession = Depends(get_session_db, scope="function"),
 ) -> UserService:
+    # Built per request on purpose: the repository wraps the request's session,
+    # so a process-wide singleton would leak one session across requests.
+    # FastAPI already resolves this once per request, however many
+    # dependants ask for it.
+    # scope="function" commits as soon as the handler returns, before the
+    # response is sent, so a failed commit reaches the client as an error
     user_repository = SQLAlchemyUserRepository(session)
     user_service = UserService(user_repository)
     return user_service
+
+
+def get_user_stream_service(
+    session: AsyncSession = Depends(get_session_db),
+) -> UserService:
+    # For read-only streaming responses: the session has to stay open until the
+    # StreamingResponse has been sent, so it closes after the response instead
+    return UserService(SQLAlchemyUserRepository(session))
@@ -1,13 +1,53 @@
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from collections.abc import AsyncIterator, Sequence
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from pydantic_core import to_json
 
 from ...services.user import UserService
-from ..dependencies import get_user_service
+from ..dependencies import get_user_stream_service
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("/", response_model=list[BaseModel])
-async def get_users(user_service: UserService = Depends(get_user_service)):
-    result = await user_service.fetch_users()
-    return result
+class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    username: str
+    email: str
+    age: int
+
+
+# Column order of the (id, username, email, age) tuples UserService.stream_users yields
+_ROW_FIELDS = ("id", "username", "email", "age")
+
+
+async def _json_array(batches: AsyncIterator[Sequence[tuple]]) -> AsyncIterator[bytes]:
+    # Emit one JSON array incrementally, a database batch at a time. Rows come
+    # straight from the database with the response's columns, so they are
+    # serialized by pydantic-core as-is rather than validated into models first
+    yield b"["
+    first = True
+    async for batch in batches:
+        if not batch:
+            continue
+        chunk = to_json([dict(zip(_ROW_FIELDS, row, strict=True)) for row in batch])[1:-1]
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
+@router.get("/", response_model=list[UserResponse])
+async def get_users(
+    limit: int | None = Query(None, ge=1, le=1000),
+    after_id: int = Query(0, ge=0),
+    user_service: UserService = Depends(get_user_stream_service),
+):
+    if limit is not None:
+        page = await user_service.fetch_users(limit, after_id)
+        return Response(content=to_json(page), media_type="application/json")
+    return StreamingResponse(
+        _json_array(user_service.stream_users(after_id)), media_type="application/json"
+    )
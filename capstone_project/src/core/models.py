@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 
 # Domain models
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     id: int | None
     username: str
@@ -10,9 +10,13 @@ class User:
     age: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     id: int | None
     sender_id: int
     receiver_id: int
     content: str
+
+
+# Flat (id, username, email, age) row, for bulk reads that skip building Users
+UserRow = tuple[int, str, str, int]
@@ -4,12 +4,22 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-engine = create_async_engine(DATABASE_URL, echo=True)
+# Room for every statement shape the repositories issue, so none is recompiled
+engine = create_async_engine(DATABASE_URL, echo=True, query_cache_size=1200)
 
 
 async_session = sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 
 async def get_session_db() -> AsyncGenerator[AsyncSession]:
+    # Unit of work: repositories only stage changes; the session commits once
+    # when the dependency exits, or rolls everything back if the handler raised.
+    # Write routes must depend on this with scope="function" so that exit runs
+    # before the response is sent
     async with async_session() as session:
-        yield session
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
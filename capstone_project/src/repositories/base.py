@@ -1,27 +1,26 @@
-from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from typing import Protocol
 
-from ..core.models import User
+from ..core.models import User, UserRow
 
 # Interfaces
 
 
-class BaseUserRepository(ABC):
-    @abstractmethod
-    async def add(self, item) -> User:
-        pass
+class BaseUserRepository(Protocol):
+    async def add(self, item) -> User: ...
 
-    @abstractmethod
-    async def get_by_id(self, item_id: int) -> User | None:
-        pass
+    async def bulk_add(self, items: list[dict]) -> list[int]: ...
 
-    @abstractmethod
-    async def get_all(self) -> list[User]:
-        pass
+    async def get_by_id(self, item_id: int) -> User | None: ...
 
-    @abstractmethod
-    async def update(self, item) -> bool:
-        pass
+    async def get_all(self, batch_size: int = 500, load_options: tuple = ()) -> list[User]: ...
 
-    @abstractmethod
-    async def delete(self, item_id: int) -> bool:
-        pass
+    async def get_page(self, limit: int, after_id: int = 0) -> list[User]: ...
+
+    def stream_all(
+        self, batch_size: int = 1000, after_id: int = 0
+    ) -> AsyncIterator[Sequence[UserRow]]: ...
+
+    async def update(self, item) -> bool: ...
+
+    async def delete(self, item_id: int) -> bool: ...
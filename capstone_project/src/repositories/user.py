@@ -1,22 +1,41 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import insert, select
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.models import User
+from ..core.models import User, UserRow
 from ..db.models import UserModel
-from .base import BaseUserRepository
+
+# Built once at import; the engine's compiled cache then serves its SQL string
+_SELECT_USERS = select(UserModel)
+# Plain columns: rows come back as tuples, with no ORM instance to build or wrap
+_SELECT_USER_ROWS = select(UserModel.id, UserModel.username, UserModel.email, UserModel.age)
 
 
-class SQLAlchemyUserRepository(BaseUserRepository):
+class SQLAlchemyUserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def add(self, item: User) -> User:
-        user = UserModel(username=item.username, email=item.email, age=item.age)
-        self.session.add(user)
-        await self.session.commit()
-        self.session.refresh(user)
-        self._to_domain_model(user)
-        return user
+        # RETURNING hands back the new row, so no refresh SELECT is needed
+        result = await self.session.execute(
+            insert(UserModel)
+            .values(username=item.username, email=item.email, age=item.age)
+            .returning(UserModel.id, UserModel.username, UserModel.email, UserModel.age)
+        )
+        return User(*result.one())
+
+    async def bulk_add(self, items: list[dict]) -> list[int]:
+        if not items:
+            # An empty parameter list would run as one INSERT ... DEFAULT VALUES
+            return []
+        # One executemany-style INSERT for the whole batch
+        result = await self.session.execute(
+            insert(UserModel).returning(UserModel.id, sort_by_parameter_order=True), items
+        )
+        return list(result.scalars())
 
     def _to_domain_model(self, user_model: UserModel) -> User:
         return User(
@@ -30,31 +49,61 @@ class SQLAlchemyUserRepository(BaseUserRepository):
         return UserModel(id=user.id, username=user.username, email=user.email, age=user.age)
 
     async def get_by_id(self, item_id: int) -> User | None:
-        result = await self.session.execute(select(UserModel).where(UserModel.id == item_id))
-        user_model = result.scalar_one_or_none()
+        # Served from the identity map without SQL if the row is already loaded
+        user_model = await self.session.get(UserModel, item_id)
         if user_model:
             return self._to_domain_model(user_model)
         return None
 
-    async def get_all(self) -> list[User]:
-        result = await self.session.execute(select(UserModel))
-        user_models = result.scalars().all()
-        return [self._to_domain_model(user_model) for user_model in user_models]
+    async def get_all(self, batch_size: int = 500, load_options: tuple = ()) -> list[User]:
+        # Fetch in yield_per batches so the ORM rows of only one batch are alive
+        # alongside the growing result list. Relationships mapped onto UserModel
+        # should be passed as load_options, e.g. (selectinload(UserModel.roles),),
+        # so each batch loads them with one IN query instead of a query per user
+        stmt = _SELECT_USERS.options(*load_options) if load_options else _SELECT_USERS
+        result = await self.session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        users: list[User] = []
+        extend = users.extend
+        user_cls = User
+        async for user_models in result.partitions():
+            extend(
+                user_cls(id=u.id, username=u.username, email=u.email, age=u.age)
+                for u in user_models
+            )
+        return users
+
+    async def get_page(self, limit: int, after_id: int = 0) -> list[User]:
+        # Keyset pagination: seek past the last seen id through the primary key
+        # index instead of scanning and discarding OFFSET rows
+        result = await self.session.execute(
+            _SELECT_USER_ROWS.where(UserModel.id > after_id).order_by(UserModel.id).limit(limit)
+        )
+        return [User(*row) for row in result]
+
+    async def stream_all(
+        self, batch_size: int = 1000, after_id: int = 0
+    ) -> AsyncIterator[Sequence[UserRow]]:
+        # Server-side cursor: only one batch of rows is held in memory at a time
+        stmt = _SELECT_USER_ROWS.order_by(UserModel.id).execution_options(yield_per=batch_size)
+        if after_id:
+            stmt = stmt.where(UserModel.id > after_id)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            # Plain tuples, so no sqlalchemy Row leaves the repository
+            yield [tuple(row) for row in rows]
 
     async def update(self, item: User) -> bool:
-        existing_user = await self.get_by_id(item.id)
-        if not existing_user:
-            return False
-        existing_user.username = item.username
-        existing_user.email = item.email
-        existing_user.age = item.age
-        await self.session.commit()
-        return True
+        # One UPDATE ... RETURNING instead of a SELECT followed by a write
+        result = await self.session.execute(
+            sa_update(UserModel)
+            .where(UserModel.id == item.id)
+            .values(username=item.username, email=item.email, age=item.age)
+            .returning(UserModel.id)
+        )
+        return result.scalar_one_or_none() is not None
 
     async def delete(self, item_id: int) -> bool:
-        user = await self.get_by_id(item_id)
-        if not user:
-            return False
-        self.session.delete(user)
-        await self.session.commit()
-        return True
+        result = await self.session.execute(
+            sa_delete(UserModel).where(UserModel.id == item_id).returning(UserModel.id)
+        )
+        return result.scalar_one_or_none() is not None
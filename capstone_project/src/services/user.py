@@ -1,27 +1,42 @@
 """module for domain logic for user service"""
 
-from ..core.models import User
+from collections.abc import AsyncIterator, Sequence
+
+from ..core.models import User, UserRow
 from ..repositories.base import BaseUserRepository
 
+_AGE_MSG = "Age must be between 1 and 149"
+
 
 class UserService:
     """Domain logic for user-related operations"""
     def __init__(self, user_repository: BaseUserRepository) -> None:
         self.repository = user_repository
 
-    def _check_age_constraints(self, age: int) -> bool:
-        # domain logic for age constraints
-        return 0 < age < 150
-
     async def register_user(self, username: str, email: str, age: int) -> User:
         # domain logic for registering a user
         # e.g., call methods for user age validation
-        if not self._check_age_constraints(age):
-            raise ValueError("Age must be between 1 and 149")
+        if not 1 <= age <= 149:
+            raise ValueError(_AGE_MSG)
 
         new_user = User(id=None, username=username, email=email, age=age)
         return await self.repository.add(new_user)
 
-    async def fetch_users(self) -> list[User]:
-        # domain logic for fetching users
-        return await self.repository.get_all()
+    async def register_users(self, users: list[tuple[str, str, int]]) -> list[int]:
+        # domain logic for registering many users in one transaction
+        rows = []
+        for username, email, age in users:
+            if not 1 <= age <= 149:
+                raise ValueError(_AGE_MSG)
+            rows.append({"username": username, "email": email, "age": age})
+        return await self.repository.bulk_add(rows)
+
+    async def fetch_users(self, limit: int | None = None, after_id: int = 0) -> list[User]:
+        # domain logic for fetching users, a page at a time when limit is given
+        if limit is None:
+            return await self.repository.get_all()
+        return await self.repository.get_page(limit, after_id)
+
+    def stream_users(self, after_id: int = 0) -> AsyncIterator[Sequence[UserRow]]:
+        # domain logic for fetching users in batches, as raw (id, username, email, age) rows
+        return self.repository.stream_all(after_id=after_id)
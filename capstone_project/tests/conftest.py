@@ -2,16 +2,39 @@
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from src.db.models import Base
-from src.db.session import get_session_db
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create a test database engine using in-memory SQLite"""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    """Create a test database engine using in-memory SQLite, with the schema built once"""
+    # StaticPool: every checkout shares the one connection, and so the one in-memory database
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        # No WAL: an in-memory database has no journal file to put in WAL mode
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself; the driver's implicit transactions
+        # would otherwise make SAVEPOINT release commit straight to the database
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -20,15 +43,22 @@ async def async_engine():
 
 @pytest_asyncio.fixture
 async def async_session(async_engine):
-    """Create a test database session"""
-    async_session_local = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session_local() as session:
-        yield session
+    """Create a test database session rolled back after each test"""
+    async with async_engine.connect() as conn:
+        trans = await conn.begin()
+        # Commits inside the test only release a SAVEPOINT; the outer
+        # transaction is rolled back so every test starts from empty tables
+        async with AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await trans.rollback()
 
 
 @pytest.fixture
 def override_get_session(async_session):
     """Override FastAPI dependency injection for testing"""
+    from src.db.session import get_session_db
     from src.main import app
 
     async def get_test_session():
@@ -0,0 +1,36 @@
+"""Integration tests for the API dependency wiring"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.api.dependencies import get_user_service
+from src.db import session as session_module
+from src.services.user import UserService
+
+
+class TestGetUserService:
+    """Test suite for the write-path session lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_is_reported_to_client(self, monkeypatch):
+        """Test a commit error turns into a 500 instead of a sent 200"""
+        session = AsyncMock()
+        session.commit.side_effect = RuntimeError("commit failed")
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+        monkeypatch.setattr(session_module, "async_session", factory)
+
+        app = FastAPI()
+
+        @app.post("/write")
+        async def write(user_service: UserService = Depends(get_user_service)):
+            return {"ok": True}
+
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/write")
+
+        assert response.status_code == 500
+        session.rollback.assert_awaited_once()
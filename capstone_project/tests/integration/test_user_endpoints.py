@@ -1,17 +1,26 @@
 """Integration tests for user API endpoints"""
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from src.main import app
+from src.db.models import UserModel
 
 
-@pytest.fixture(scope="function")
-async def async_client(override_get_session):
-    """Create an async test client"""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _shared_client():
+    """Create one async test client for the whole session"""
+    from src.main import app
+
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
 
+@pytest.fixture(scope="function")
+def async_client(_shared_client, override_get_session):
+    """Shared client with this test's database session installed"""
+    return _shared_client
+
+
 class TestUserEndpoints:
     """Test suite for user API endpoints"""
 
@@ -31,3 +40,48 @@ class TestUserEndpoints:
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_get_users_returns_stored_users(self, async_client, async_session):
+        """Test GET /users serializes stored users"""
+        async_session.add(UserModel(username="john", email="john@test.com", age=25))
+        await async_session.commit()
+
+        response = await async_client.get("/api/v1/users/")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": 1, "username": "john", "email": "john@test.com", "age": 25}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_users_paginates_by_id(self, async_client, async_session):
+        """Test GET /users returns the page after the given id"""
+        async_session.add_all(
+            [
+                UserModel(username=name, email=f"{name}@test.com", age=25)
+                for name in ("ann", "bob", "cat")
+            ]
+        )
+        await async_session.commit()
+
+        response = await async_client.get("/api/v1/users/", params={"limit": 1, "after_id": 1})
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": 2, "username": "bob", "email": "bob@test.com", "age": 25}]
+
+    @pytest.mark.asyncio
+    async def test_get_users_after_id_without_limit(self, async_client, async_session):
+        """Test GET /users honours after_id when streaming the full list"""
+        async_session.add_all(
+            [
+                UserModel(username=name, email=f"{name}@test.com", age=25)
+                for name in ("ann", "bob", "cat")
+            ]
+        )
+        await async_session.commit()
+
+        response = await async_client.get("/api/v1/users/", params={"after_id": 1})
+
+        assert response.status_code == 200
+        assert [user["username"] for user in response.json()] == ["bob", "cat"]
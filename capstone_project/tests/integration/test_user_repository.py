@@ -0,0 +1,126 @@
+"""Integration tests for the SQLAlchemy user repository"""
+
+import pytest
+from sqlalchemy.orm import load_only
+from src.core.models import User
+from src.db.models import UserModel
+from src.repositories.user import SQLAlchemyUserRepository
+
+
+async def _seed_users(session, count):
+    session.add_all(
+        UserModel(username=f"user{i}", email=f"user{i}@test.com", age=20 + i)
+        for i in range(1, count + 1)
+    )
+    await session.commit()
+
+
+class TestSQLAlchemyUserRepository:
+    """Test suite for repository reads and writes"""
+
+    @pytest.mark.asyncio
+    async def test_get_all_collects_every_partition(self, async_session):
+        """Test get_all returns every user when rows span several yield_per batches"""
+        await _seed_users(async_session, 5)
+        repository = SQLAlchemyUserRepository(async_session)
+
+        users = await repository.get_all(batch_size=2)
+
+        assert users == [
+            User(id=i, username=f"user{i}", email=f"user{i}@test.com", age=20 + i)
+            for i in range(1, 6)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_all_applies_load_options(self, async_session):
+        """Test get_all accepts loader options alongside batching"""
+        await _seed_users(async_session, 3)
+        repository = SQLAlchemyUserRepository(async_session)
+
+        users = await repository.get_all(
+            batch_size=2,
+            load_options=(load_only(UserModel.username, UserModel.email, UserModel.age),),
+        )
+
+        assert [user.username for user in users] == ["user1", "user2", "user3"]
+
+    @pytest.mark.asyncio
+    async def test_stream_all_yields_batches_after_id(self, async_session):
+        """Test stream_all yields rows in batch_size chunks, starting past after_id"""
+        await _seed_users(async_session, 5)
+        repository = SQLAlchemyUserRepository(async_session)
+
+        batches = [rows async for rows in repository.stream_all(batch_size=2, after_id=1)]
+
+        assert [[row[0] for row in rows] for rows in batches] == [[2, 3], [4, 5]]
+        assert batches[0][0] == (2, "user2", "user2@test.com", 22)
+        assert type(batches[0][0]) is tuple
+
+    @pytest.mark.asyncio
+    async def test_add_returns_domain_user(self, async_session):
+        """Test add persists the user and returns it with its new id"""
+        repository = SQLAlchemyUserRepository(async_session)
+
+        user = await repository.add(User(id=None, username="john", email="john@test.com", age=25))
+
+        assert user == User(id=1, username="john", email="john@test.com", age=25)
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_returns_ids_in_order(self, async_session):
+        """Test bulk_add inserts every row and returns their ids in input order"""
+        repository = SQLAlchemyUserRepository(async_session)
+
+        ids = await repository.bulk_add(
+            [
+                {"username": "john", "email": "john@test.com", "age": 25},
+                {"username": "jane", "email": "jane@test.com", "age": 30},
+            ]
+        )
+
+        assert ids == [1, 2]
+        assert (await repository.get_by_id(2)).username == "jane"
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_empty_batch(self, async_session):
+        """Test bulk_add with no rows inserts nothing"""
+        repository = SQLAlchemyUserRepository(async_session)
+
+        assert await repository.bulk_add([]) == []
+        assert await repository.get_all() == []
+
+    @pytest.mark.asyncio
+    async def test_update_persists_changes(self, async_session):
+        """Test update writes the new values to the database"""
+        async_session.add(UserModel(username="john", email="john@test.com", age=25))
+        await async_session.commit()
+        repository = SQLAlchemyUserRepository(async_session)
+
+        updated = await repository.update(
+            User(id=1, username="johnny", email="johnny@test.com", age=26)
+        )
+        async_session.expire_all()
+
+        assert updated is True
+        assert await repository.get_by_id(1) == User(
+            id=1, username="johnny", email="johnny@test.com", age=26
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_missing_user(self, async_session):
+        """Test update reports False when no user has the id"""
+        repository = SQLAlchemyUserRepository(async_session)
+
+        updated = await repository.update(User(id=1, username="ghost", email="g@test.com", age=30))
+
+        assert updated is False
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_user(self, async_session):
+        """Test delete removes the row and reports whether it existed"""
+        async_session.add(UserModel(username="john", email="john@test.com", age=25))
+        await async_session.commit()
+        repository = SQLAlchemyUserRepository(async_session)
+
+        assert await repository.delete(1) is True
+        assert await repository.delete(1) is False
+        assert await repository.get_by_id(1) is None
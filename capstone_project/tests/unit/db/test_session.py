@@ -0,0 +1,44 @@
+"""Unit tests for the unit-of-work session dependency"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.db import session as session_module
+
+
+@pytest.fixture
+def mock_session(monkeypatch):
+    """Replace the session factory with one handing out a mock session"""
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    monkeypatch.setattr(session_module, "async_session", factory)
+    return session
+
+
+class TestGetSessionDb:
+    """Test suite for the unit-of-work behaviour of get_session_db"""
+
+    @pytest.mark.asyncio
+    async def test_commits_when_request_succeeds(self, mock_session):
+        """Test the session is committed once the request finishes"""
+        dependency = session_module.get_session_db()
+
+        assert await anext(dependency) is mock_session
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+
+        mock_session.commit.assert_awaited_once()
+        mock_session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_when_request_fails(self, mock_session):
+        """Test the session is rolled back and the error re-raised"""
+        dependency = session_module.get_session_db()
+        await anext(dependency)
+
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("handler failed"))
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()